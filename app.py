@@ -1,4 +1,5 @@
 import streamlit as st
+from dados import iniciar_carregamento_dados, ler_tickers_acoes
 
 pages  = {
     "Dashboards": [
@@ -7,5 +8,12 @@ pages  = {
     ],
 }
 
+# Inicia o download dos dados em segundo plano enquanto a navegação é montada.
+# Os tickers são lidos aqui, na thread do script; se faltarem, a página exibe o erro.
+try:
+    iniciar_carregamento_dados(ler_tickers_acoes())
+except FileNotFoundError:
+    pass
+
 pg = st.navigation(pages, position="sidebar")
 pg.run()
\ No newline at end of file
@@ -0,0 +1,27 @@
+# Gera o arquivo tickers_const.py a partir do IBOV.csv
+# Execute sempre que o IBOV.csv for atualizado: python build_tickers.py
+import pandas as pd
+
+ARQUIVO_TICKERS = "IBOV.csv"
+ARQUIVO_SAIDA = "tickers_const.py"
+
+def gerar_tickers():
+    """
+    Lê os códigos das ações do IBOV.csv e grava em ARQUIVO_SAIDA uma tupla
+    TICKERS com os tickers já no formato do Yahoo Finance (sufixo '.SA').
+    """
+    codigos = pd.read_csv(
+        ARQUIVO_TICKERS, sep=";", usecols=["Código"], dtype="string", engine="pyarrow"
+    )["Código"]
+    tickers = (codigos + ".SA").tolist()
+    linhas = "".join(f"    {ticker!r},\n" for ticker in tickers)
+    conteudo = (
+        f"# Arquivo gerado por build_tickers.py a partir do {ARQUIVO_TICKERS}. Não edite manualmente.\n"
+        f"TICKERS = (\n{linhas})\n"
+    )
+    with open(ARQUIVO_SAIDA, "w", encoding="utf-8") as arquivo:
+        arquivo.write(conteudo)
+    print(f"{len(tickers)} tickers gravados em '{ARQUIVO_SAIDA}'.")
+
+if __name__ == "__main__":
+    gerar_tickers()
@@ -0,0 +1,456 @@
+# Módulo de carregamento de dados compartilhado pelo app.py e pelas páginas.
+# Fica fora dos arquivos das páginas porque o Streamlit executa cada página como
+# um módulo '__main__' novo, o que duplicaria os caches de st.cache_resource.
+import streamlit as st
+import pandas as pd
+import numpy as np
+import yfinance as yf
+import aiohttp
+import asyncio
+import hashlib
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+import tempfile
+from pathlib import Path
+
+# --- CONSTANTES ---
+ARQUIVO_TICKERS = "IBOV.csv"
+DATA_INICIO = "2010-01-01"
+DATA_FIM = "2025-01-01"
+PASTA_CACHE = Path("cache")
+TAMANHO_LOTE = 20  # Quantidade de tickers por requisição ao Yahoo Finance
+MAX_WORKERS = 8
+URL_CHART = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+CABECALHOS_HTTP = {"User-Agent": "Mozilla/5.0"}
+CONCORRENCIA_INICIAL = 4
+CONCORRENCIA_MAXIMA = 32
+JANELA_MONITOR = 2.0  # Segundos entre cada ajuste da concorrência
+
+# --- FUNÇÕES DE CARREGAMENTO DE DADOS ---
+@st.cache_data
+def ler_tickers_acoes() -> list[str]:
+    """
+    Lê a lista de tickers, já com o sufixo '.SA' para consulta no Yahoo Finance.
+    Usa a tupla pré-gerada em tickers_const.py (ver build_tickers.py) e, se ela não
+    existir, lê o arquivo CSV local. Não exibe nada na interface.
+
+    Returns:
+        list[str]: Uma lista de tickers (ex: ['PETR4.SA', 'VALE3.SA']).
+
+    Raises:
+        FileNotFoundError: Se o arquivo CSV não for encontrado.
+    """
+    try:
+        from tickers_const import TICKERS
+        return list(TICKERS)
+    except ImportError:
+        pass
+
+    # Lê apenas a coluna de códigos, com o leitor do pyarrow
+    codigos = pd.read_csv(
+        ARQUIVO_TICKERS, sep=";", usecols=["Código"], dtype="string", engine="pyarrow"
+    )["Código"]
+    return (codigos + ".SA").tolist()
+
+def carregar_tickers_acoes() -> list[str]:
+    """
+    Carrega a lista de tickers com ler_tickers_acoes.
+    Trata o erro caso o arquivo não seja encontrado, exibindo a mensagem na página.
+
+    Returns:
+        list[str]: Uma lista de tickers (ex: ['PETR4.SA', 'VALE3.SA']).
+                   Retorna uma lista vazia se o arquivo não for encontrado.
+    """
+    try:
+        return ler_tickers_acoes()
+    except FileNotFoundError:
+        st.error(f"Erro: O arquivo '{ARQUIVO_TICKERS}' não foi encontrado.")
+        st.info("Por favor, certifique-se de que o arquivo está na mesma pasta que o seu script Streamlit.")
+        # Retorna uma lista vazia para que o app não quebre completamente.
+        # A verificação na função main() impedirá a continuação.
+        return []
+
+def caminhos_cache(empresas: list[str]) -> tuple[Path, Path, Path]:
+    """
+    Monta os caminhos do cache em disco (parquet + meta.json) para um conjunto de tickers.
+    A chave não inclui DATA_FIM: o meta.json registra até onde os dados já foram baixados,
+    permitindo apenas complementar o período quando DATA_FIM avança.
+
+    Args:
+        empresas (list[str]): Lista de tickers.
+
+    Returns:
+        tuple[Path, Path, Path]: Caminho do parquet diário, do arquivo de metadados
+                                 e do parquet com a variação mensal (usado pela página 2).
+    """
+    chave = hashlib.sha1((",".join(sorted(empresas)) + DATA_INICIO).encode("utf-8")).hexdigest()
+    return (
+        PASTA_CACHE / f"{chave}.parquet",
+        PASTA_CACHE / f"{chave}.meta.json",
+        PASTA_CACHE / f"{chave}_monthly.parquet",
+    )
+
+def _baixar_lote(lote: list[str], inicio: str, fim: str) -> pd.DataFrame:
+    """
+    Baixa os dados brutos de um lote de tickers em uma única chamada ao yf.download.
+
+    Args:
+        lote (list[str]): Lote de tickers.
+        inicio (str): Data inicial (inclusiva).
+        fim (str): Data final (exclusiva).
+
+    Returns:
+        pd.DataFrame: DataFrame com MultiIndex (ticker, campo) nas colunas.
+    """
+    return yf.download(
+        tickers=lote,
+        start=inicio,
+        end=fim,
+        group_by="ticker",
+        auto_adjust=True,
+        threads=False,
+        progress=False
+    )
+
+def _baixar_fechamento_yf(empresas: list[str], inicio: str, fim: str) -> pd.DataFrame:
+    """
+    Baixa os preços de fechamento de uma lista de tickers usando o yfinance.
+
+    Args:
+        empresas (list[str]): Lista de tickers para baixar os dados.
+        inicio (str): Data inicial (inclusiva), no formato 'AAAA-MM-DD'.
+        fim (str): Data final (exclusiva), no formato 'AAAA-MM-DD'.
+
+    Returns:
+        pd.DataFrame: DataFrame com as datas no índice e os preços de fechamento
+                      de cada empresa em uma coluna.
+    """
+    # Divide os tickers em lotes e baixa cada lote em paralelo
+    lotes = [empresas[i:i + TAMANHO_LOTE] for i in range(0, len(empresas), TAMANHO_LOTE)]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        frames = list(executor.map(lambda lote: _baixar_lote(lote, inicio, fim), lotes))
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame()
+    dados_brutos = pd.concat(frames, axis=1, sort=True)
+    # Extrai de uma só vez a coluna 'Close' de todos os tickers do MultiIndex
+    fechamento = dados_brutos.xs('Close', axis=1, level=1, drop_level=True)
+    # Mantém a ordem dos tickers; os que falharam viram colunas vazias, removidas em seguida
+    return fechamento.reindex(columns=empresas).dropna(axis=1, how='all')
+
+class _ControleConcorrencia:
+    """
+    Limita o número de requisições simultâneas e ajusta esse limite sondando a vazão.
+    Cada janela termina quando 'limite' requisições foram concluídas (uma rodada completa)
+    ou após JANELA_MONITOR segundos. Ao fim de cada janela o limite é dobrado para medir a
+    próxima, e segue dobrando enquanto a vazão (bytes/s) subir ao menos 10%; duas quedas
+    consecutivas reduzem o limite pela metade.
+    """
+    def __init__(self, inicial: int = CONCORRENCIA_INICIAL, maximo: int = CONCORRENCIA_MAXIMA):
+        self.limite = inicial
+        self.maximo = maximo
+        self._ativas = 0
+        self._bytes_janela = 0
+        self._concluidas_janela = 0
+        self._janela_completa = asyncio.Event()
+        self._condicao = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._condicao:
+            await self._condicao.wait_for(lambda: self._ativas < self.limite)
+            self._ativas += 1
+
+    async def __aexit__(self, *exc):
+        async with self._condicao:
+            self._ativas -= 1
+            self._condicao.notify()
+
+    def registrar(self, num_bytes: int):
+        """Contabiliza os bytes recebidos por uma requisição concluída."""
+        self._bytes_janela += num_bytes
+        self._concluidas_janela += 1
+        if self._concluidas_janela >= self.limite:
+            self._janela_completa.set()
+
+    async def monitorar(self):
+        """Tarefa de fundo que reavalia o limite de concorrência a cada janela."""
+        loop = asyncio.get_running_loop()
+        vazao_anterior = None
+        quedas = 0
+        while True:
+            inicio = loop.time()
+            try:
+                await asyncio.wait_for(self._janela_completa.wait(), JANELA_MONITOR)
+            except asyncio.TimeoutError:
+                pass
+            vazao = self._bytes_janela / (loop.time() - inicio)
+            self._bytes_janela = 0
+            self._concluidas_janela = 0
+            self._janela_completa.clear()
+            if vazao > 0 and (vazao_anterior is None or vazao >= vazao_anterior * 1.1):
+                # A vazão ainda cresce (ou é a primeira medição): sonda um limite maior
+                self.limite = min(self.limite * 2, self.maximo)
+                quedas = 0
+            elif vazao_anterior is not None and vazao < vazao_anterior:
+                quedas += 1
+                if quedas >= 2:
+                    self.limite = max(self.limite // 2, 1)
+                    quedas = 0
+            else:
+                quedas = 0
+            vazao_anterior = vazao
+            # Libera as requisições que aguardavam caso o limite tenha aumentado
+            async with self._condicao:
+                self._condicao.notify_all()
+
+async def _buscar_fechamento(sessao: aiohttp.ClientSession, controle: _ControleConcorrencia,
+                             ticker: str, periodo: dict) -> pd.Series | None:
+    """
+    Consulta o endpoint de gráfico do Yahoo Finance e retorna o fechamento ajustado de um ticker.
+
+    Args:
+        sessao (aiohttp.ClientSession): Sessão HTTP compartilhada entre as requisições.
+        controle (_ControleConcorrencia): Controle que limita as requisições simultâneas.
+        ticker (str): Ticker a ser consultado.
+        periodo (dict): Parâmetros 'period1' e 'period2' (timestamps em segundos).
+
+    Returns:
+        pd.Series | None: Série com as datas no índice, ou None se o ticker não pôde ser baixado.
+    """
+    try:
+        async with controle:
+            async with sessao.get(URL_CHART.format(ticker=ticker), params={**periodo, "interval": "1d"}) as resposta:
+                resposta.raise_for_status()
+                corpo = await resposta.read()
+        controle.registrar(len(corpo))
+        conteudo = json.loads(corpo)
+        resultado = conteudo["chart"]["result"][0]
+        valores = resultado["indicators"]["adjclose"][0]["adjclose"]
+        fuso = resultado["meta"]["exchangeTimezoneName"]
+        datas = pd.to_datetime(resultado["timestamp"], unit="s", utc=True).tz_convert(fuso)
+        # Falha (ValueError) se os preços e as datas vierem com tamanhos diferentes
+        serie = pd.Series(valores, index=datas.tz_localize(None).normalize().rename("Date"), dtype="float64")
+    except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, IndexError, TypeError, ValueError):
+        return None
+    # O último pregão pode vir duplicado (cotação intradiária), mantém apenas o mais recente
+    serie = serie[~serie.index.duplicated(keep="last")]
+    return serie if serie.notna().any() else None
+
+async def _buscar_todos(empresas: list[str], inicio: str, fim: str) -> pd.DataFrame:
+    """
+    Baixa de forma assíncrona os preços de fechamento de todos os tickers.
+
+    Args:
+        empresas (list[str]): Lista de tickers.
+        inicio (str): Data inicial (inclusiva).
+        fim (str): Data final (exclusiva).
+
+    Returns:
+        pd.DataFrame: DataFrame com uma coluna para cada ticker baixado com sucesso.
+    """
+    periodo = {"period1": int(pd.Timestamp(inicio).timestamp()), "period2": int(pd.Timestamp(fim).timestamp())}
+    timeout = aiohttp.ClientTimeout(total=30)
+    controle = _ControleConcorrencia()
+    monitor = asyncio.create_task(controle.monitorar())
+    try:
+        async with aiohttp.ClientSession(headers=CABECALHOS_HTTP, timeout=timeout) as sessao:
+            series = await asyncio.gather(
+                *[_buscar_fechamento(sessao, controle, ticker, periodo) for ticker in empresas]
+            )
+    finally:
+        monitor.cancel()
+    baixados = {ticker: serie for ticker, serie in zip(empresas, series) if serie is not None}
+    if not baixados:
+        return pd.DataFrame()
+    return pd.concat(baixados.values(), axis=1, keys=baixados.keys(), sort=True)
+
+def _baixar_fechamento(empresas: list[str], inicio: str, fim: str) -> pd.DataFrame:
+    """
+    Baixa do Yahoo Finance os preços de fechamento de uma lista de tickers em um período.
+    Usa requisições assíncronas ao endpoint de gráfico e recorre ao yfinance apenas
+    para os tickers que falharem.
+
+    Args:
+        empresas (list[str]): Lista de tickers para baixar os dados.
+        inicio (str): Data inicial (inclusiva), no formato 'AAAA-MM-DD'.
+        fim (str): Data final (exclusiva), no formato 'AAAA-MM-DD'.
+
+    Returns:
+        pd.DataFrame: DataFrame com as datas no índice e os preços de fechamento
+                      de cada empresa em uma coluna.
+    """
+    fechamento = asyncio.run(_buscar_todos(empresas, inicio, fim))
+    faltantes = [ticker for ticker in empresas if ticker not in fechamento.columns]
+    if faltantes:
+        fechamento = pd.concat([fechamento, _baixar_fechamento_yf(faltantes, inicio, fim)], axis=1, sort=True)
+    # As páginas dependem das linhas em ordem cronológica
+    return fechamento.reindex(columns=empresas).dropna(axis=1, how='all').sort_index()
+
+def _gravar_atomicamente(arquivo: Path, escrever):
+    """
+    Grava o arquivo em um temporário na mesma pasta e só então o move para o destino,
+    para que uma leitura concorrente nunca encontre um arquivo pela metade.
+
+    Args:
+        arquivo (Path): Caminho final do arquivo.
+        escrever (Callable[[str], None]): Função que grava o conteúdo no caminho recebido.
+    """
+    PASTA_CACHE.mkdir(parents=True, exist_ok=True)
+    descritor, temporario = tempfile.mkstemp(dir=arquivo.parent, suffix=".tmp")
+    os.close(descritor)
+    try:
+        escrever(temporario)
+        os.replace(temporario, arquivo)
+    except BaseException:
+        Path(temporario).unlink(missing_ok=True)
+        raise
+
+def salvar_parquet(df: pd.DataFrame, arquivo: Path):
+    """
+    Salva um DataFrame em parquet (zstd) de forma atômica.
+
+    Args:
+        df (pd.DataFrame): DataFrame a ser salvo.
+        arquivo (Path): Caminho do arquivo parquet.
+    """
+    _gravar_atomicamente(arquivo, lambda caminho: df.to_parquet(caminho, compression="zstd"))
+
+def _salvar_cache(fechamento: pd.DataFrame, arquivo: Path, arquivo_meta: Path, arquivo_mensal: Path):
+    """
+    Salva os preços de fechamento em parquet e registra até onde os dados foram baixados.
+    A variação mensal salva anteriormente é descartada, pois foi calculada sobre os dados antigos.
+
+    Args:
+        fechamento (pd.DataFrame): DataFrame com os preços de fechamento.
+        arquivo (Path): Caminho do arquivo parquet.
+        arquivo_meta (Path): Caminho do arquivo de metadados.
+        arquivo_mensal (Path): Caminho do parquet com a variação mensal.
+    """
+    arquivo_mensal.unlink(missing_ok=True)
+    salvar_parquet(fechamento, arquivo)
+    _gravar_atomicamente(
+        arquivo_meta,
+        lambda caminho: Path(caminho).write_text(json.dumps({"data_fim": DATA_FIM}), encoding="utf-8")
+    )
+
+def _tickers_reajustados(fechamento: pd.DataFrame, novos_dados: pd.DataFrame) -> list[str]:
+    """
+    Identifica os tickers cujos preços ajustados no cache não batem mais com os recém-baixados.
+    O Yahoo reajusta todo o histórico de um ticker a cada desdobramento ou dividendo, então o
+    último pregão do cache é comparado com o mesmo dia nos dados novos; qualquer diferença
+    indica que o histórico salvo daquele ticker está em outra escala.
+
+    Args:
+        fechamento (pd.DataFrame): Preços de fechamento salvos no cache.
+        novos_dados (pd.DataFrame): Preços baixados a partir do último pregão do cache.
+
+    Returns:
+        list[str]: Tickers que precisam ter o histórico completo baixado novamente
+                   (inclui os que ainda não existiam no cache).
+    """
+    ultima_data = fechamento.index.max()
+    # Sem o dia em comum não há como validar nenhum ticker
+    if ultima_data not in novos_dados.index:
+        return novos_dados.columns.tolist()
+    antes = fechamento.loc[ultima_data].reindex(novos_dados.columns).to_numpy(dtype="float64")
+    depois = novos_dados.loc[ultima_data].to_numpy(dtype="float64")
+    iguais = np.isclose(antes, depois, rtol=1e-6, atol=0, equal_nan=True)
+    # Tickers ausentes do cache também precisam do histórico completo
+    iguais &= novos_dados.columns.isin(fechamento.columns)
+    return novos_dados.columns[~iguais].tolist()
+
+@st.cache_data
+def carregar_dados(empresas: list[str]) -> pd.DataFrame:
+    """
+    Carrega os dados históricos de preços de fechamento para uma lista de tickers.
+    Os dados ficam salvos em disco (parquet) e são reaproveitados entre reinícios do app;
+    apenas o período ainda não baixado é buscado no Yahoo Finance. Os tickers cujo histórico
+    ajustado mudou (desdobramentos e dividendos) são baixados novamente por completo.
+
+    Args:
+        empresas (list[str]): Lista de tickers para baixar os dados.
+
+    Returns:
+        pd.DataFrame: DataFrame com as datas no índice e os preços de fechamento
+                      de cada empresa em uma coluna.
+    """
+    arquivo, arquivo_meta, arquivo_mensal = caminhos_cache(empresas)
+
+    # Caso 1: Existe cache em disco, baixa apenas o que falta (se faltar algo)
+    if arquivo.exists() and arquivo_meta.exists():
+        fechamento = pd.read_parquet(arquivo)
+        baixado_ate = json.loads(arquivo_meta.read_text(encoding="utf-8"))["data_fim"]
+        if baixado_ate < DATA_FIM:
+            # Baixa a partir do último pregão salvo, para comparar esse dia nas duas versões
+            ultima_data = fechamento.index.max()
+            novos_dados = _baixar_fechamento(empresas, ultima_data.strftime("%Y-%m-%d"), DATA_FIM)
+            if not novos_dados.empty:
+                reajustados = _tickers_reajustados(fechamento, novos_dados)
+                # Tickers sem reajuste: acrescenta o período novo ao histórico salvo
+                fechamento = novos_dados.drop(columns=reajustados).combine_first(fechamento)
+                # Tickers reajustados: substitui a série inteira, mas só com o que de fato foi baixado.
+                # Os que falharem mantêm o histórico salvo, ainda coerente, sem o período novo
+                historico = _baixar_fechamento(reajustados, DATA_INICIO, DATA_FIM) if reajustados else pd.DataFrame()
+                if not historico.empty:
+                    fechamento = pd.concat(
+                        [fechamento.drop(columns=historico.columns, errors="ignore"), historico], axis=1, sort=True
+                    )
+                # Com algum ticker pendente o cache não é gravado, para tentar de novo no próximo início
+                pendentes = set(reajustados) - set(historico.columns)
+                if not pendentes:
+                    _salvar_cache(fechamento, arquivo, arquivo_meta, arquivo_mensal)
+    # Caso 2: Sem cache, baixa o período completo
+    else:
+        fechamento = _baixar_fechamento(empresas, DATA_INICIO, DATA_FIM)
+        if not fechamento.empty:
+            _salvar_cache(fechamento, arquivo, arquivo_meta, arquivo_mensal)
+
+    # Garante o índice datetime já no carregamento, evitando conversões nas páginas
+    fechamento.index = pd.to_datetime(fechamento.index)
+    # DATA_FIM é exclusiva, assim como no yf.download.
+    # As colunas ficam em ordem alfabética, o que também ordena as opções do filtro de ações
+    fechamento = fechamento[fechamento.index < DATA_FIM].sort_index(axis=1)
+    # float32 é suficiente para preços e reduz pela metade a memória das etapas seguintes
+    return fechamento.astype("float32")
+
+@st.cache_resource
+def iniciar_carregamento_dados(empresas: list[str]) -> Future:
+    """
+    Inicia em segundo plano o carregamento dos dados das ações informadas.
+    Chamada pelo app.py na inicialização, para que o download ocorra enquanto a
+    navegação é montada. O Future é único e compartilhado entre páginas e sessões.
+    Os tickers devem ser lidos antes, na thread do script, para que um arquivo ausente
+    seja informado na página em vez de se perder na thread de fundo.
+
+    Args:
+        empresas (list[str]): Lista de tickers (retornada por ler_tickers_acoes).
+
+    Returns:
+        Future: Future cujo resultado é o DataFrame retornado por carregar_dados.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    futuro = executor.submit(carregar_dados, empresas)
+    # Encerra a thread assim que o carregamento terminar
+    executor.shutdown(wait=False)
+    return futuro
+
+def obter_dados(empresas: list[str]) -> pd.DataFrame:
+    """
+    Aguarda o carregamento iniciado por iniciar_carregamento_dados e retorna os dados.
+    Se o carregamento falhou, descarta o Future do cache antes de repassar o erro,
+    para que o próximo rerun tente baixar os dados novamente.
+
+    Args:
+        empresas (list[str]): Lista de tickers (retornada por ler_tickers_acoes).
+
+    Returns:
+        pd.DataFrame: DataFrame retornado por carregar_dados.
+    """
+    futuro = iniciar_carregamento_dados(empresas)
+    # exception() aguarda o término do carregamento
+    with st.spinner("Carregando os dados das ações..."):
+        erro = futuro.exception()
+    if erro is not None:
+        iniciar_carregamento_dados.clear()
+    return futuro.result()
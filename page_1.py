@@ -1,67 +1,12 @@
 # Importar as bibliotecas necessárias
 import streamlit as st
 import pandas as pd
-import yfinance as yf
 from datetime import timedelta
 
-# --- CONSTANTES ---
-ARQUIVO_TICKERS = "IBOV.csv"
-DATA_INICIO = "2010-01-01"
-DATA_FIM = "2025-01-01"
-
-# --- FUNÇÕES DE CARREGAMENTO DE DADOS ---
-@st.cache_data
-def carregar_tickers_acoes() -> list[str]:
-    """
-    Carrega a lista de tickers a partir de um arquivo CSV local.
-    Adiciona o sufixo '.SA' para consulta no Yahoo Finance.
-    Trata o erro caso o arquivo não seja encontrado.
-
-    Returns:
-        list[str]: Uma lista de tickers (ex: ['PETR4.SA', 'VALE3.SA']).
-                   Retorna uma lista vazia se o arquivo não for encontrado.
-    """
-    try:
-        base_tickers = pd.read_csv(ARQUIVO_TICKERS, sep=";")
-        tickers = base_tickers["Código"].tolist()
-        return [f"{item}.SA" for item in tickers]
-    except FileNotFoundError:
-        st.error(f"Erro: O arquivo '{ARQUIVO_TICKERS}' não foi encontrado.")
-        st.info("Por favor, certifique-se de que o arquivo está na mesma pasta que o seu script Streamlit.")
-        # Retorna uma lista vazia para que o app não quebre completamente.
-        # A verificação na função main() impedirá a continuação.
-        return []
-
-@st.cache_data
-def carregar_dados(empresas: list[str]) -> pd.DataFrame:
-    """
-    Baixa os dados históricos de preços de fechamento para uma lista de tickers.
-
-    Args:
-        empresas (list[str]): Lista de tickers para baixar os dados.
-
-    Returns:
-        pd.DataFrame: DataFrame com as datas no índice e os preços de fechamento
-                      de cada empresa em uma coluna.
-    """
-    dados_brutos = yf.download(
-        tickers=empresas,
-        start=DATA_INICIO,
-        end=DATA_FIM,
-        group_by="ticker",
-        auto_adjust=True,
-        threads=True
-    )
-    # Extrai apenas a coluna 'Close' de cada ticker, tratando o MultiIndex
-    fechamento = pd.DataFrame()
-    for ticker in empresas:
-        # Verifica se o ticker foi baixado com sucesso antes de tentar acessá-lo
-        if ticker in dados_brutos.columns.levels[0]:
-            fechamento[ticker] = dados_brutos[ticker]['Close']
-    return fechamento
+from dados import carregar_tickers_acoes, obter_dados
 
 # --- FUNÇÕES DE INTERFACE E FILTROS ---
-def configurar_sidebar(dados: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+def configurar_sidebar(dados: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
     """
     Configura a barra lateral (sidebar) com os filtros de ações e datas.
 
@@ -69,9 +14,9 @@ def configurar_sidebar(dados: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]
         dados (pd.DataFrame): O DataFrame completo com todos os dados das ações.
 
     Returns:
-        tuple[pd.DataFrame, pd.DataFrame]:
-            - O DataFrame filtrado apenas pelas ações selecionadas.
+        tuple[pd.DataFrame, list[str]]:
             - O DataFrame filtrado pelas ações E pelo intervalo de datas.
+            - A lista de ações selecionadas.
     """
     st.sidebar.header("Filtros")
 
@@ -80,19 +25,14 @@ def configurar_sidebar(dados: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]
 
     # Caso 1: Nenhuma ação selecionada
     if not lista_acoes:
-        # Retorna o dataframe original, uma lista vazia e None
+        # Retorna o dataframe original e uma lista vazia
         # O filtro de data será aplicado sobre o dataframe completo
         dados_filtrados = dados
-        acao_unica = None
     
     # Caso 2: Uma ou mais ações selecionadas
     else:
-        dados_filtrados = dados[lista_acoes]
-        acao_unica = None
-        # Se só uma ação foi selecionada, renomeia a coluna para "Close"
-        if len(lista_acoes) == 1:
-            acao_unica = lista_acoes[0]
-            dados_filtrados = dados_filtrados.rename(columns={acao_unica: "Close"})
+        # Seleciona as colunas por máscara booleana, sem resolver cada rótulo individualmente
+        dados_filtrados = dados.loc[:, dados.columns.isin(lista_acoes)]
 
     # Aplica o filtro de datas sobre o resultado da seleção de ações
     data_inicial = dados_filtrados.index.min().to_pydatetime()
@@ -106,47 +46,50 @@ def configurar_sidebar(dados: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]
         format="DD/MM/YYYY"
     )
     
-    dados_filtrados_final = dados_filtrados.loc[intervalo_data[0]:intervalo_data[1]]
+    # Se o período é o intervalo completo, evita criar uma cópia desnecessária
+    if intervalo_data == (data_inicial, data_final):
+        dados_filtrados_final = dados_filtrados
+    else:
+        dados_filtrados_final = dados_filtrados.loc[intervalo_data[0]:intervalo_data[1]]
     
-    return dados_filtrados_final, lista_acoes, acao_unica
+    return dados_filtrados_final, lista_acoes
 
 
 # --- FUNÇÕES DE CÁLCULO E PLOTAGEM ---
-def calcular_performance(dados: pd.DataFrame, lista_acoes: list[str], acao_unica: str) -> str:
+def calcular_performance(dados: pd.DataFrame, lista_acoes: list[str]) -> str:
     """
     Calcula a performance de cada ativo no DataFrame fornecido.
     Lida corretamente com ações que possuem dados faltantes no início do período.
 
     Args:
-        dados_periodo (pd.DataFrame): DataFrame com os dados do período selecionado.
+        dados (pd.DataFrame): DataFrame com os dados do período selecionado.
+        lista_acoes (list[str]): Lista das ações selecionadas.
 
     Returns:
         str: Uma string formatada em Markdown com a performance de cada ativo.
     """
-    texto_performance = ""
-    # Itera sobre cada coluna (ação) do DataFrame do período
-    if len(lista_acoes) == 1:
-        # Nesse caso, os dados têm a coluna "Close", que representa a única ação
-        dados = dados.rename(columns={"Close": acao_unica})
-    
     if not lista_acoes:
         return "Nenhuma ação selecionada para calcular a performance."
-    
-    for acao in lista_acoes:
-        
-        # 1. Cria uma série para a ação e REMOVE os valores NaN.
-        #    Isso é crucial para pegar o primeiro valor real da ação no período.
-        serie_acao_sem_nan = dados[acao].dropna()
 
-        # 2. Garante que, após remover os NaNs, ainda temos pelo menos 2 pontos para o cálculo.
-        if len(serie_acao_sem_nan) > 1:
-            # 3. Pega o primeiro e o último valor da SÉRIE LIMPA.
-            valor_inicial = serie_acao_sem_nan.iloc[0]
-            valor_final = serie_acao_sem_nan.iloc[-1]
+    # Os dados já chegam filtrados pelas ações selecionadas (ver configurar_sidebar).
+    # Quantidade de valores válidos de cada ação no período.
+    # São necessários pelo menos 2 pontos para o cálculo.
+    quantidade_valores = dados.count()
+    if dados.empty:
+        valores_iniciais = valores_finais = pd.Series(float("nan"), index=dados.columns)
+    else:
+        # Primeiro e último valor real (não NaN) de cada ação, calculados para todas de uma vez
+        valores_iniciais = dados.bfill().iloc[0]
+        valores_finais = dados.ffill().iloc[-1]
+    performances = valores_finais / valores_iniciais - 1
 
+    texto_performance = ""
+    # Itera apenas sobre os resultados já calculados para montar o texto
+    for acao in lista_acoes:
+        if quantidade_valores[acao] > 1:
             # Garante que não estamos dividindo por zero
-            if valor_inicial != 0:
-                performance = (valor_final / valor_inicial) - 1
+            if valores_iniciais[acao] != 0:
+                performance = performances[acao]
                 cor = "green" if performance > 0 else "red" if performance < 0 else "gray"
                 texto_performance += f"**{acao}**: :{cor}[{performance:.2%}]  \n"
             else:
@@ -175,10 +118,13 @@ def main():
     """Função principal que executa a página."""
     st.title("Evolução e Performance das Ações")
 
-    dados_completos = carregar_dados(carregar_tickers_acoes())
+    tickers = carregar_tickers_acoes()
+    if not tickers:
+        return # Para a execução se não encontrar tickers
+    # Aguarda o carregamento iniciado pelo app.py (ou o inicia, se ainda não foi feito)
+    dados_completos = obter_dados(tickers)
     
-    # A função de filtro agora retorna 3 valores
-    dados_filtrados, lista_acoes, acao_unica = configurar_sidebar(dados_completos)
+    dados_filtrados, lista_acoes = configurar_sidebar(dados_completos)
 
     # Se a lista de ações estiver vazia, mostra uma mensagem.
     # Caso contrário, exibe os dashboards.
@@ -189,7 +135,7 @@ def main():
         plotar_grafico(dados_filtrados)
 
         st.subheader("Performance dos Ativos no Período")
-        texto_performance = calcular_performance(dados_filtrados, lista_acoes, acao_unica)
+        texto_performance = calcular_performance(dados_filtrados, lista_acoes)
         st.markdown(texto_performance)
 
 
@@ -1,17 +1,29 @@
 # Importar as bibliotecas necessárias
 import streamlit as st
 import pandas as pd
+import numpy as np
+import json
 from datetime import datetime
 
-# Importa as funções que serão reutilizadas da page_1
-# Verifica se o arquivo page_1.py está na mesma pasta
+# Importa as funções de carregamento compartilhadas com a page_1
+# Verifica se o arquivo dados.py está na mesma pasta
 try:
-    from page_1 import carregar_tickers_acoes, carregar_dados
+    from dados import (
+        DATA_FIM, caminhos_cache, carregar_tickers_acoes, obter_dados, salvar_parquet
+    )
 except ImportError:
-    st.error("O arquivo 'page_1.py' não foi encontrado. Certifique-se de que ele está na mesma pasta.")
+    st.error("O arquivo 'dados.py' não foi encontrado. Certifique-se de que ele está na mesma pasta.")
     st.stop()
 
 # --- FUNÇÕES DE CÁLCULO E PROCESSAMENTO ---
+def _chave_dataframe(df: pd.DataFrame) -> tuple:
+    """
+    Gera uma chave barata para o cache a partir do formato, das colunas e da última data,
+    evitando que o Streamlit precise calcular o hash de todos os valores do DataFrame.
+    """
+    return df.shape, tuple(df.columns), df.index[-1] if len(df) else None
+
+@st.cache_data(hash_funcs={pd.DataFrame: _chave_dataframe})
 def calcular_variacao_mensal(dados: pd.DataFrame) -> pd.DataFrame:
     """
     Calcula a variação percentual mensal dos preços de fechamento
@@ -21,13 +33,43 @@ def calcular_variacao_mensal(dados: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame com a variação percentual mensal para cada ativo
     """
-    # Garante que o índice é do tipo datetime
-    dados.index = pd.to_datetime(dados.index)
-    # Reorganiza para último dia de cada mês e calcula a variação
-    df_mensal = dados.resample('ME').last()
+    # Garante que o índice é do tipo datetime, sem alterar o DataFrame recebido
+    if not isinstance(dados.index, pd.DatetimeIndex):
+        dados = dados.copy()
+        dados.index = pd.to_datetime(dados.index)
+    # Reorganiza para último dia de cada mês e calcula a variação.
+    # Agrupar pelo período ano-mês é mais barato que o resample('ME') e gera o mesmo resultado.
+    df_mensal = dados.groupby(dados.index.to_period('M')).last()
+    df_mensal.index = df_mensal.index.to_timestamp(how='end').normalize()
     variacao_mensal = df_mensal.pct_change(fill_method=None)
     return variacao_mensal
 
+@st.cache_data
+def carregar_variacao_mensal(empresas: list[str]) -> pd.DataFrame:
+    """
+    Obtém a variação mensal das ações, reaproveitando o resultado salvo em disco.
+    Se o parquet mensal corresponde aos dados diários atuais (mesma DATA_FIM), ele é lido
+    diretamente, sem aguardar o download nem recalcular o agrupamento mensal.
+
+    Args:
+        empresas (list[str]): Lista de tickers.
+
+    Returns:
+        pd.DataFrame: DataFrame com a variação percentual mensal para cada ativo.
+                      Vazio se os dados diários não puderam ser carregados.
+    """
+    _, arquivo_meta, arquivo_mensal = caminhos_cache(empresas)
+    if arquivo_mensal.exists() and arquivo_meta.exists():
+        if json.loads(arquivo_meta.read_text(encoding="utf-8"))["data_fim"] == DATA_FIM:
+            return pd.read_parquet(arquivo_mensal)
+
+    dados_diarios = obter_dados(empresas)
+    if dados_diarios.empty:
+        return pd.DataFrame()
+    variacao_mensal = calcular_variacao_mensal(dados_diarios)
+    salvar_parquet(variacao_mensal, arquivo_mensal)
+    return variacao_mensal
+
 # --- FUNÇÕES DE INTERFACE E FILTROS ---
 def configurar_filtros(dados_variacao: pd.DataFrame) -> pd.DataFrame:
     """
@@ -85,7 +127,9 @@ def configurar_filtros(dados_variacao: pd.DataFrame) -> pd.DataFrame:
         if data_inicial > data_final:
             st.error("A data inicial não pode ser posterior à data final")
             return pd.DataFrame()
-        dados_filtrados = dados_filtrados.loc[data_inicial:data_final]
+        # Só recorta quando o intervalo escolhido não cobre todo o período disponível
+        if (data_inicial, data_final) != (data_minima.date(), data_maxima.date()):
+            dados_filtrados = dados_filtrados.loc[data_inicial:data_final]
     else:
         st.warning("Por favor, selecione um intervalo de datas válido")
         return pd.DataFrame()
@@ -98,18 +142,23 @@ def configurar_filtros(dados_variacao: pd.DataFrame) -> pd.DataFrame:
             filtros_variacao.append("Baixa")
         if st.checkbox("Apenas Estáveis (0%)", key="estavel_filtro"):
             filtros_variacao.append("Estável")
-    # Aplica o filtro de variação (Alta/Baixa/Estável) se alguma opção foi marcada
-    if filtros_variacao:
-        mascara = pd.DataFrame(False, index=dados_filtrados.index, columns=dados_filtrados.columns)
+    # Aplica o filtro de variação (Alta/Baixa/Estável) se alguma opção foi marcada.
+    # Com as três opções marcadas todo valor válido passa, então o filtro é dispensado.
+    if filtros_variacao and len(filtros_variacao) < 3:
+        # Compara direto no array numpy, sem criar DataFrames intermediários alinhados por rótulo
+        valores = dados_filtrados.to_numpy(copy=False)
+        mascara = np.zeros(valores.shape, dtype=bool)
         if "Alta" in filtros_variacao:
-            mascara |= (dados_filtrados > 0)
+            mascara |= valores > 0
         if "Baixa" in filtros_variacao:
-            mascara |= (dados_filtrados < 0)
+            mascara |= valores < 0
         if "Estável" in filtros_variacao:
-            mascara |= (dados_filtrados == 0)
+            mascara |= valores == 0
         # Mantém a estrutura do DF, preenchendo com NaN onde a condição é falsa
         dados_filtrados = dados_filtrados.where(mascara)
-    return dados_filtrados.dropna(how='all') # Remove linhas onde todos os valores são NaN
+    # Remove linhas onde todos os valores são NaN, usando uma única passada no array numpy
+    manter = ~np.isnan(dados_filtrados.to_numpy(copy=False)).all(axis=1)
+    return dados_filtrados.iloc[manter]
 
 # --- FUNÇÕES DE PLOTAGEM E EXIBIÇÃO ---
 def exibir_dashboard(dados_filtrados: pd.DataFrame):
@@ -122,31 +171,29 @@ def exibir_dashboard(dados_filtrados: pd.DataFrame):
     if dados_filtrados.empty:
         st.warning("Nenhum dado encontrado para os filtros selecionados")
         return
-    # Formata o índice para o formato Ano/Mês
-    dados_para_plotar = dados_filtrados.copy()
-    dados_para_plotar.index = dados_para_plotar.index.strftime('%Y-%m')
+    # Formata o índice para o formato Ano/Mês uma única vez, reutilizado no gráfico e na tabela
+    rotulos_mes = dados_filtrados.index.strftime('%Y-%m')
     # Multiplica por 100 para exibir em formato percentual e usa stack para as barras não serem empilhadas, e sim lado a lado
-    st.bar_chart(dados_para_plotar * 100, height=500, stack=False)
+    st.bar_chart((dados_filtrados * 100).set_axis(rotulos_mes), height=500, stack=False)
     st.write("---")
     st.subheader("Dados Filtrados")
     # Mostra os dados em formato de tabela, formatados como percentual
-    st.dataframe(dados_filtrados.style.format("{:.2%}"))
+    st.dataframe(dados_filtrados.set_axis(rotulos_mes).style.format("{:.2%}"))
 
 # --- FUNÇÃO PRINCIPAL (MAIN) ---
 def main():
     """
     Função principal que organiza e executa o aplicativo Streamlit para a página 2
     """
-    # 1. Carregar os dados base (usando as funções da página 1)
+    # 1. Carregar os dados base (usando as funções do dados.py)
     tickers = carregar_tickers_acoes()
     if not tickers:
         return # Para a execução se não encontrar tickers
-    dados_diarios = carregar_dados(tickers)
-    if dados_diarios.empty:
+    # 2. Obter a variação mensal (do cache em disco ou processando os dados diários)
+    variacao_mensal = carregar_variacao_mensal(tickers)
+    if variacao_mensal.empty:
         st.error("Não foi possível carregar os dados das ações")
         return
-    # 2. Processar os dados para obter a variação mensal
-    variacao_mensal = calcular_variacao_mensal(dados_diarios)
     # 3. Configurar os filtros e obter os dados finais
     dados_finais_filtrados = configurar_filtros(variacao_mensal)
     # 4. Exibir o dashboard com os dados filtrados